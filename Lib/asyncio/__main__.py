@@ -1,7 +1,6 @@
 import ast
 import asyncio
-import concurrent.futures
-import inspect
+import contextvars
 import os
 import site
 import sys
@@ -12,7 +11,43 @@
 from _colorize import can_colorize, ANSIColors  # type: ignore[import-not-found]
 from _pyrepl.console import InteractiveColoredConsole
 
-from . import futures
+
+# Module globals copied into the namespace of the REPL.
+_REPL_GLOBAL_KEYS = ('__name__', '__package__', '__loader__', '__spec__',
+                     '__builtins__', '__file__')
+
+
+class _REPLResult:
+    """Single-use slot handing a statement's outcome to the REPL thread.
+
+    There is exactly one producer (the event loop) and one consumer
+    (the REPL thread), so a bare event is enough; this avoids the
+    condition-variable bookkeeping of concurrent.futures.Future.
+    """
+
+    __slots__ = ('event', 'result', 'exc')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.exc = None
+
+    def set_result(self, result):
+        self.result = result
+        self.event.set()
+
+    def set_exception(self, exc):
+        self.exc = exc
+        self.event.set()
+
+    def wait(self):
+        self.event.wait()
+        if self.exc is not None:
+            # Clear the slot so that the exception's traceback, which
+            # references the frame holding this object, forms no cycle.
+            exc, self.exc = self.exc, None
+            raise exc
+        return self.result
 
 
 class AsyncIOInteractiveConsole(InteractiveColoredConsole):
@@ -22,10 +57,24 @@ def __init__(self, locals, loop):
         self.compile.compiler.flags |= ast.PyCF_ALLOW_TOP_LEVEL_AWAIT
 
         self.loop = loop
+        self.context = contextvars.copy_context()
 
     def runcode(self, code):
         global return_code
-        future = concurrent.futures.Future()
+        slot = _REPLResult()
+        function_type = types.FunctionType
+        namespace = self.locals
+
+        def _on_done(task):
+            # The task is already done, so a single result() call reads
+            # its final state: it returns the result or raises the
+            # exception (CancelledError if the task was cancelled).
+            try:
+                result = task.result()
+            except BaseException as exc:
+                slot.set_exception(exc)
+            else:
+                slot.set_result(result)
 
         def callback():
             global return_code
@@ -35,7 +84,7 @@ def callback():
             repl_future = None
             keyboard_interrupted = False
 
-            func = types.FunctionType(code, self.locals)
+            func = function_type(code, namespace)
             try:
                 coro = func()
             except SystemExit as se:
@@ -44,26 +93,26 @@ def callback():
                 return
             except KeyboardInterrupt as ex:
                 keyboard_interrupted = True
-                future.set_exception(ex)
+                slot.set_exception(ex)
                 return
             except BaseException as ex:
-                future.set_exception(ex)
+                slot.set_exception(ex)
                 return
 
-            if not inspect.iscoroutine(coro):
-                future.set_result(coro)
+            if not isinstance(coro, types.CoroutineType):
+                slot.set_result(coro)
                 return
 
             try:
-                repl_future = self.loop.create_task(coro)
-                futures._chain_future(repl_future, future)
+                repl_future = self.loop.create_task(coro, context=self.context)
+                repl_future.add_done_callback(_on_done)
             except BaseException as exc:
-                future.set_exception(exc)
+                slot.set_exception(exc)
 
-        loop.call_soon_threadsafe(callback)
+        loop.call_soon_threadsafe(callback, context=self.context)
 
         try:
-            return future.result()
+            return slot.wait()
         except SystemExit as se:
             return_code = se.code
             self.loop.stop()
@@ -88,22 +137,27 @@ def run(self):
                 f'for more information.\n'
             )
 
-            console.write(banner)
-
-            if startup_path := os.getenv("PYTHONSTARTUP"):
+            # Emit the banner and the "import asyncio" line in one write,
+            # unless a startup script has to run (and print) in between.
+            environ = os.environ
+            startup_text = banner
+            if startup_path := environ.get("PYTHONSTARTUP"):
+                console.write(startup_text)
+                startup_text = ""
                 import tokenize
                 with tokenize.open(startup_path) as f:
                     startup_code = compile(f.read(), startup_path, "exec")
-                    exec(startup_code, console.locals)
+                exec(startup_code, console.locals)
 
             ps1 = getattr(sys, "ps1", ">>> ")
             if can_colorize():
                 ps1 = f"{ANSIColors.BOLD_MAGENTA}{ps1}{ANSIColors.RESET}"
-            console.write(f"{ps1}import asyncio\n")
+            startup_text += f"{ps1}import asyncio\n"
+            console.write(startup_text)
 
             try:
                 import errno
-                if os.getenv("PYTHON_BASIC_REPL"):
+                if environ.get("PYTHON_BASIC_REPL"):
                     raise RuntimeError("user environment requested basic REPL")
                 if not os.isatty(sys.stdin.fileno()):
                     raise OSError(errno.ENOTTY, "tty required", "stdin")
@@ -116,7 +170,7 @@ def run(self):
                 if err := check():
                     raise RuntimeError(err)
             except Exception as e:
-                console.interact(banner="", exitmsg=exit_message)
+                console.interact(banner="", exitmsg="")
             else:
                 try:
                     run_multiline_interactive_console(console=console)
@@ -144,11 +198,9 @@ def run(self):
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
 
+    module_globals = globals()
     repl_locals = {'asyncio': asyncio}
-    for key in {'__name__', '__package__',
-                '__loader__', '__spec__',
-                '__builtins__', '__file__'}:
-        repl_locals[key] = locals()[key]
+    repl_locals.update((key, module_globals[key]) for key in _REPL_GLOBAL_KEYS)
 
     console = AsyncIOInteractiveConsole(repl_locals, loop)
 
@@ -185,7 +237,8 @@ def run(self):
             loop.run_forever()
         except KeyboardInterrupt:
             keyboard_interrupted = True
-            if repl_future and not repl_future.done():
+            # cancel() is a no-op on a task that is already done.
+            if repl_future is not None:
                 repl_future.cancel()
             continue
         else:
@@ -350,7 +350,17 @@ def _copy_future_state(source, dest):
     if dest.cancelled():
         return
     assert not dest.done()
-    if source.cancelled():
+    if isinstance(source, concurrent.futures.Future):
+        # Read the whole state under one lock acquisition instead of
+        # taking the lock in each of cancelled(), exception() and result().
+        _, cancelled, result, exception = source._get_snapshot()
+        if cancelled:
+            dest.cancel()
+        elif exception is not None:
+            dest.set_exception(_convert_future_exc(exception))
+        else:
+            dest.set_result(result)
+    elif source.cancelled():
         dest.cancel()
     else:
         exception = source.exception()
@@ -397,6 +397,27 @@ def __get_result(self):
         else:
             return self._result
 
+    def _get_snapshot(self):
+        """Return the state of the future as a single consistent tuple.
+
+        This takes at most one lock acquisition, where querying done(),
+        cancelled(), exception() and result() in turn takes one each.
+
+        Returns:
+            A (done, cancelled, result, exception) tuple. result and
+            exception are None unless the future finished executing.
+        """
+        # A finished future never changes state again, so no lock is needed.
+        if self._state == FINISHED:
+            return True, False, self._result, self._exception
+
+        with self._condition:
+            if self._state == FINISHED:
+                return True, False, self._result, self._exception
+            if self._state in [CANCELLED, CANCELLED_AND_NOTIFIED]:
+                return True, True, None, None
+            return False, False, None, None
+
     def add_done_callback(self, fn):
         """Attaches a callable that will be called when the future finishes.
 
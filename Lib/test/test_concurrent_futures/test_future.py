@@ -282,6 +282,24 @@ def test_multiple_set_exception(self):
 
         self.assertEqual(f.exception(), e)
 
+    def test_get_snapshot(self):
+        self.assertEqual(PENDING_FUTURE._get_snapshot(),
+                         (False, False, None, None))
+        self.assertEqual(RUNNING_FUTURE._get_snapshot(),
+                         (False, False, None, None))
+        self.assertEqual(CANCELLED_FUTURE._get_snapshot(),
+                         (True, True, None, None))
+        self.assertEqual(CANCELLED_AND_NOTIFIED_FUTURE._get_snapshot(),
+                         (True, True, None, None))
+        self.assertEqual(SUCCESSFUL_FUTURE._get_snapshot(),
+                         (True, False, 42, None))
+
+        done, cancelled, result, exception = EXCEPTION_FUTURE._get_snapshot()
+        self.assertTrue(done)
+        self.assertFalse(cancelled)
+        self.assertIsNone(result)
+        self.assertIsInstance(exception, OSError)
+
 
 def setUpModule():
     setup_module()
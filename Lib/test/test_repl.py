@@ -198,6 +198,80 @@ def bar(x):
     def test_asyncio_repl_is_ok(self):
         assert_python_ok("-m", "asyncio")
 
+    def test_asyncio_repl_echoes_result(self):
+        p = spawn_repl("-m", "asyncio")
+        p.stdin.write("await asyncio.sleep(0, 42)\n")
+        output = kill_python(p)
+        self.assertEqual(p.returncode, 0)
+        self.assertNotIn("Error", output)
+        self.assertRegex(output, r"(?m)^(>>> )*42$")
+
+    def test_asyncio_repl_sync_exception(self):
+        user_input = dedent("""\
+        1/0
+        await asyncio.sleep(0, "after the exception")
+        """)
+        p = spawn_repl("-m", "asyncio")
+        p.stdin.write(user_input)
+        output = kill_python(p)
+        self.assertEqual(p.returncode, 0)
+        self.assertIn("ZeroDivisionError: division by zero", output)
+        self.assertIn("'after the exception'", output)
+
+    def test_asyncio_repl_async_exception(self):
+        user_input = dedent("""\
+        async def f(): raise ValueError("from a coroutine")
+
+        await f()
+        await asyncio.sleep(0, "after the exception")
+        """)
+        p = spawn_repl("-m", "asyncio")
+        p.stdin.write(user_input)
+        output = kill_python(p)
+        self.assertEqual(p.returncode, 0)
+        self.assertIn("ValueError: from a coroutine", output)
+        self.assertIn("'after the exception'", output)
+
+    def test_asyncio_repl_toplevel_contextvars_sync(self):
+        user_input = dedent("""\
+        from contextvars import ContextVar
+        var = ContextVar("var", default="failed")
+        var.set("ok")
+        async def get_var(): return var.get()
+
+        print(f"toplevel contextvar test: {await get_var()}")
+        """)
+        p = spawn_repl("-m", "asyncio")
+        p.stdin.write(user_input)
+        output = kill_python(p)
+        self.assertEqual(p.returncode, 0)
+        # The statements must run in the asyncio REPL, not in the regular
+        # REPL that -i falls back to if the asyncio REPL thread dies.
+        self.assertNotIn("Error", output)
+        expected = "toplevel contextvar test: ok"
+        self.assertIn(expected, output, expected)
+
+    def test_asyncio_repl_toplevel_contextvars_async(self):
+        user_input = dedent("""\
+        from contextvars import ContextVar
+        var = ContextVar("var", default="failed")
+        async def set_var(): var.set("ok")
+
+        async def get_var(): return var.get()
+
+        await set_var()
+        print(f"toplevel contextvar test: {await get_var()}")
+        """)
+        p = spawn_repl("-m", "asyncio")
+        p.stdin.write(user_input)
+        output = kill_python(p)
+        self.assertEqual(p.returncode, 0)
+        # The statements must run in the asyncio REPL, not in the regular
+        # REPL that -i falls back to if the asyncio REPL thread dies.
+        self.assertNotIn("Error", output)
+        expected = "toplevel contextvar test: ok"
+        self.assertIn(expected, output, expected)
+
 
 class TestInteractiveModeSyntaxErrors(unittest.TestCase):
 